@@ -34,6 +34,9 @@
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 
+import importlib
+import sys
+
 from .version import __version__, __btversion__
 
 # =============================================================================
@@ -114,7 +117,6 @@ from . import utils as utils   # 유틸리티 함수들
 from . import feeds as feeds           # 데이터 피드 모듈들
 from . import indicators as indicators # 기술적 지표 모듈들
 from . import indicators as ind        # indicators의 짧은 별칭
-from . import studies as studies       # 연구 모듈들
 from . import strategies as strategies # 전략 모듈들
 from . import strategies as strats     # strategies의 짧은 별칭
 from . import observers as observers   # 관찰자 모듈들
@@ -130,13 +132,47 @@ from . import brokers as brokers       # 브로커 모듈들
 from . import timer as timer           # 타이머 모듈
 
 # =============================================================================
-# TA-Lib 지표 지원 모듈 임포트
+# 사용자 정의 지표 모듈 로드
 # =============================================================================
-from . import talib as talib   # TA-Lib 통합 지표들
+# contrib 지표들은 bt.indicators 네임스페이스에 등록되므로 즉시 로드합니다
+import backtrader.indicators.contrib    # 사용자 정의 지표들
 
 # =============================================================================
-# 사용자 정의 지표 및 연구 모듈 로드
+# 지연 로드(lazy load) 모듈
 # =============================================================================
-# contrib 디렉토리에 있는 추가 기능들을 자동으로 로드합니다
-import backtrader.indicators.contrib    # 사용자 정의 지표들
-import backtrader.studies.contrib       # 사용자 정의 연구 모듈들
+# 핵심 모듈들이 사용하지 않는 무거운 모듈들은 처음 접근할 때 임포트합니다
+# (PEP 562 모듈 수준 __getattr__). 값은 함께 임포트할 모듈들의 튜플이며
+# 첫 번째 모듈이 속성으로 반환됩니다
+# - talib: TA-Lib 통합 지표들 (설치되어 있으면 수백 개의 클래스 생성)
+# - studies: 연구 모듈들 (패키지가 직접 contrib 연구 모듈들을 등록)
+_LAZY_MODULES = {
+    'talib': ('backtrader.talib',),
+    'studies': ('backtrader.studies',),
+}
+
+
+def __getattr__(name):
+    try:
+        modnames = _LAZY_MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            "module '%s' has no attribute '%s'" % (__name__, name))
+
+    for modname in modnames:
+        importlib.import_module(modname)
+
+    module = globals()[name] = sys.modules[modnames[0]]
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES))
+
+
+if sys.version_info < (3, 7):
+    # 모듈 수준 __getattr__ 는 Python 3.7 이상에서만 동작하므로 즉시 임포트
+    # (module level __getattr__ needs Python >= 3.7: import eagerly)
+    for _name in _LAZY_MODULES:
+        __getattr__(_name)
+
+    del _name
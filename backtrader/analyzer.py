@@ -310,6 +310,7 @@ class TimeFrameAnalyzerBase(with_metaclass(MetaTimeFrameAnalyzerBase,
         self.compression = self.p.compression or self.data._compression
 
         self.dtcmp, self.dtkey = self._get_dt_cmpkey(datetime.datetime.min)
+        self._dtnum = None  # last checked system datetime (float)
         super(TimeFrameAnalyzerBase, self)._start()
 
     def _prenext(self):
@@ -348,6 +349,11 @@ class TimeFrameAnalyzerBase(with_metaclass(MetaTimeFrameAnalyzerBase,
             dtcmp, dtkey = MAXINT, datetime.datetime.max
         else:
             # With >= 1.9.x the system datetime is in the strategy
+            dtnum = self.strategy.datetime[0]
+            if dtnum == self._dtnum:
+                return False  # same datetime as last check, same period
+
+            self._dtnum = dtnum
             dt = self.strategy.datetime.datetime()
             dtcmp, dtkey = self._get_dt_cmpkey(dt)
 
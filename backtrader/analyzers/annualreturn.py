@@ -34,13 +34,80 @@
 # Annual Return = (연말 가치 / 연초 가치) - 1
 # =============================================================================
 
-from __future__ import (absolute_import, division, print_function,
-                        unicode_literals)
-
 from collections import OrderedDict
+import datetime
+
+from backtrader import Analyzer, num2date
+
+
+# =============================================================================
+# 날짜 숫자 -> 연도 변환 함수
+# =============================================================================
+def _num2years(dtnums, tz=None):
+    '''Yields the year of each of the float datetimes in ``dtnums``
+
+    Without timezone the integer part of the float is the proleptic
+    gregorian ordinal of the date, which gives the year directly without
+    building a full ``datetime`` and is computed only once per day. Only
+    the last day of the year goes through ``num2date`` because its
+    microsecond rounding could move the timestamp into the next year
+    '''
+    if tz is not None:
+        # 시간대 변환이 필요하면 전체 변환을 사용
+        for x in dtnums:
+            yield num2date(x, tz=tz).year
+
+        return
+
+    lastordinal = None
+    for x in dtnums:
+        ordinal = int(x)
+        if ordinal != lastordinal:
+            lastordinal = ordinal
+            d = datetime.date.fromordinal(ordinal)
+            year, yearend = d.year, (d.month == 12 and d.day == 31)
+
+        yield num2date(x).year if yearend else year
+
+
+# =============================================================================
+# 연도 경계 스캔 함수
+# =============================================================================
+def _year_bounds(years, values):
+    '''Scans the ``years``/``values`` sequences (oldest first) in a single
+    forward pass and yields a ``(year, value_start, value_end)`` tuple for each
+    year found
+
+    The start value of a year is the end value of the previous year, except
+    for the 1st year in which the 1st loaded value is used
+    '''
+    cur_year = None     # 현재 처리 중인 연도
+    value_start = 0.0   # 연도 시작 시 포트폴리오 가치
+    value_end = 0.0     # 연도 끝 시 포트폴리오 가치
+
+    for year, value in zip(years, values):
+        if year != cur_year:
+            if cur_year is None:
+                # No value set whatsoever, use the currently loaded value
+                # 아직 값이 설정되지 않았으므로, 현재 로드된 값을 시작값으로 사용
+                value_start = value
+            else:
+                yield cur_year, value_start, value_end
+
+                # changing between real years, use last value as new start
+                # 실제 연도가 바뀌었으므로, 마지막 값을 새로운 시작값으로 사용
+                value_start = value_end
 
-from backtrader.utils.py3 import range
-from backtrader import Analyzer
+            cur_year = year  # 현재 연도 업데이트
+
+        # No matter what, the last value is always the last loaded value
+        # 어떤 경우든 마지막 값은 항상 마지막으로 로드된 값
+        value_end = value
+
+    if cur_year is not None:
+        # finish calculating pending data
+        # 대기 중인 마지막 연도 반환
+        yield cur_year, value_start, value_end
 
 
 # =============================================================================
@@ -74,15 +141,6 @@ class AnnualReturn(Analyzer):
         # =============================================================================
         # Must have stats.broker
         # 브로커 통계가 있어야 함
-        
-        cur_year = -1  # 현재 처리 중인 연도 (-1은 초기값)
-
-        # =============================================================================
-        # 가치 변수 초기화
-        # =============================================================================
-        value_start = 0.0  # 연도 시작 시 포트폴리오 가치
-        value_cur = 0.0    # 현재 포트폴리오 가치
-        value_end = 0.0    # 연도 끝 시 포트폴리오 가치
 
         # =============================================================================
         # 결과 저장 구조 초기화
@@ -91,49 +149,25 @@ class AnnualReturn(Analyzer):
         self.ret = OrderedDict()     # 연도별 수익률을 저장하는 딕셔너리 (순서 유지)
 
         # =============================================================================
-        # 데이터를 역순으로 순회하며 연간 수익률 계산
+        # 날짜와 포트폴리오 가치를 한 번에 가져오기
         # =============================================================================
-        # range(len(self.data) - 1, -1, -1): 데이터의 마지막부터 처음까지 역순으로
-        for i in range(len(self.data) - 1, -1, -1):
-            dt = self.data.datetime.date(-i)                    # 현재 날짜
-            value_cur = self.strategy.stats.broker.value[-i]    # 현재 포트폴리오 가치
-
-            if dt.year > cur_year:
-                # =============================================================================
-                # 새로운 연도가 시작되었을 때
-                # =============================================================================
-                if cur_year >= 0:
-                    # =============================================================================
-                    # 이전 연도의 수익률 계산 및 저장
-                    # =============================================================================
-                    # 연간 수익률 = (연말 가치 / 연초 가치) - 1
-                    annualret = (value_end / value_start) - 1.0
-                    self.rets.append(annualret)        # 리스트에 추가
-                    self.ret[cur_year] = annualret     # 딕셔너리에 저장
-
-                    # changing between real years, use last value as new start
-                    # 실제 연도가 바뀌었으므로, 마지막 값을 새로운 시작값으로 사용
-                    value_start = value_end
-                else:
-                    # No value set whatsoever, use the currently loaded value
-                    # 아직 값이 설정되지 않았으므로, 현재 로드된 값을 시작값으로 사용
-                    value_start = value_cur
-
-                cur_year = dt.year  # 현재 연도 업데이트
-
-            # No matter what, the last value is always the last loaded value
-            # 어떤 경우든 마지막 값은 항상 마지막으로 로드된 값
-            value_end = value_cur
+        # 바(bar)마다 [-i] 인덱싱을 하는 대신 버퍼의 슬라이스를 한 번에 가져옴
+        size = len(self.data)
+        dtline = self.data.datetime
+        dtnums = dtline.get(size=size)                              # 날짜 (float)
+        values = self.strategy.stats.broker.value.get(size=size)   # 포트폴리오 가치
+
+        # 연도는 스캔과 함께 한 번의 순방향 순회로 계산 (중간 리스트 없음)
+        years = _num2years(dtnums, tz=dtline._tz)
 
         # =============================================================================
-        # 마지막 연도의 수익률 계산 (아직 계산되지 않은 경우)
+        # 연도 경계를 한 번에 스캔하여 연간 수익률 계산
         # =============================================================================
-        if cur_year not in self.ret:
-            # finish calculating pending data
-            # 대기 중인 데이터 계산 완료
+        for year, value_start, value_end in _year_bounds(years, values):
+            # 연간 수익률 = (연말 가치 / 연초 가치) - 1
             annualret = (value_end / value_start) - 1.0
-            self.rets.append(annualret)
-            self.ret[cur_year] = annualret
+            self.rets.append(annualret)   # 리스트에 추가
+            self.ret[year] = annualret    # 딕셔너리에 저장
 
     def get_analysis(self):
         # =============================================================================
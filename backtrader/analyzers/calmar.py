@@ -41,8 +41,7 @@
 # - 2.0 이상이면 우수한 전략
 # =============================================================================
 
-from __future__ import (absolute_import, division, print_function,
-                        unicode_literals)
+import array
 
 import backtrader as bt
 from . import TimeDrawDown
@@ -104,7 +103,7 @@ class Calmar(bt.TimeFrameAnalyzerBase):
     # =============================================================================
     # 필요한 패키지 정의
     # =============================================================================
-    packages = ('collections', 'math',)
+    packages = ('math',)
 
     # =============================================================================
     # 분석기 파라미터 설정
@@ -130,12 +129,20 @@ class Calmar(bt.TimeFrameAnalyzerBase):
         self._mdd = float('-inf')  # 최대 낙폭 초기화 (음의 무한대)
         
         # =============================================================================
-        # 롤링 윈도우를 위한 값 저장소 초기화
+        # 롤링 윈도우를 위한 링 버퍼 초기화
         # =============================================================================
-        # 지정된 기간만큼 NaN 값으로 초기화된 덱 생성
-        self._values = collections.deque([float('Nan')] * self.p.period,
-                                         maxlen=self.p.period)
-        
+        # 지정된 기간만큼 NaN 값으로 미리 할당된 배열('d')과 쓰기 위치 인덱스
+        # (쓰기 위치는 항상 윈도우에서 가장 오래된 값을 가리킴)
+        # 기간은 실행 중 바뀌지 않으므로 한 번만 읽어 고정
+        self._period = period = self.p.period
+        self._values = array.array('d', [float('Nan')]) * period
+        self._head = 0
+
+        # 기간별 결과는 키와 값 리스트에 쌓아 두고 get_analysis 에서 반영
+        self._dtkeys = list()
+        self._calmars = list()
+        self._nrows = 0  # 결과 딕셔너리에 이미 반영된 행의 수
+
         if self.p.fund is None:
             # 펀드 모드가 설정되지 않았으면 브로커의 설정을 자동 감지
             self._fundmode = self.strategy.broker.fundmode
@@ -148,21 +155,49 @@ class Calmar(bt.TimeFrameAnalyzerBase):
         # =============================================================================
         if not self._fundmode:
             # 펀드 모드가 아닌 경우: 총 순자산 가치 사용
-            self._values.append(self.strategy.broker.getvalue())
+            self._push(self.strategy.broker.getvalue())
         else:
             # 펀드 모드인 경우: 펀드 가치 사용
-            self._values.append(self.strategy.broker.fundvalue)
+            self._push(self.strategy.broker.fundvalue)
+
+    def _push(self, value):
+        # 링 버퍼에 새 값을 기록하고 쓰기 위치를 전진 (가장 오래된 값을 덮어씀)
+        head = self._head
+        self._values[head] = value
+        head += 1
+        self._head = head if head < self._period else 0  # wrap without modulo
 
     def on_dt_over(self):
-        self._mdd = max(self._mdd, self._maxdd.maxdd)
+        mdd = self._maxdd.maxdd
+        if mdd > self._mdd:
+            self._mdd = mdd
+        else:
+            mdd = self._mdd
+
+        broker = self.strategy.broker
         if not self._fundmode:
-            self._values.append(self.strategy.broker.getvalue())
+            value = broker.getvalue()
         else:
-            self._values.append(self.strategy.broker.fundvalue)
-        rann = math.log(self._values[-1] / self._values[0]) / len(self._values)
-        self.calmar = calmar = rann / (self._mdd or float('Inf'))
+            value = broker.fundvalue
+
+        self._push(value)
+        vold = self._values[self._head]  # oldest value in the window
+        # log(value / vold) as log1p of the relative change: more accurate for
+        # the small changes expected between periods
+        rann = math.log1p((value - vold) / vold) / self._period
+        self.calmar = calmar = rann / (mdd or float('Inf'))
 
-        self.rets[self.dtkey] = calmar
+        self._dtkeys.append(self.dtkey)
+        self._calmars.append(calmar)
 
     def stop(self):
         self.on_dt_over()  # update last values
+
+    def get_analysis(self):
+        # 아직 반영되지 않은 기간들을 결과 딕셔너리에 추가한 후 반환
+        dtkeys, calmars = self._dtkeys, self._calmars
+        for i in range(self._nrows, len(dtkeys)):
+            self.rets[dtkeys[i]] = calmars[i]
+
+        self._nrows = len(dtkeys)
+        return self.rets
@@ -35,9 +35,6 @@
 # Drawdown = (최고점 - 현재값) / 최고점 × 100%
 # =============================================================================
 
-from __future__ import (absolute_import, division, print_function,
-                        unicode_literals)
-
 import backtrader as bt
 from backtrader.utils import AutoOrderedDict
 
@@ -45,6 +42,24 @@ from backtrader.utils import AutoOrderedDict
 __all__ = ['DrawDown', 'TimeDrawDown']
 
 
+# =============================================================================
+# _DrawDownStats 클래스 - 낙폭 통계 저장 객체
+# =============================================================================
+# 바(bar)마다 갱신되는 낙폭 통계를 __slots__ 속성으로 보관합니다.
+# AutoOrderedDict 의 해시/점 표기법 비용 없이 속성을 읽고 쓸 수 있습니다.
+class _DrawDownStats(object):
+    __slots__ = ('len', 'drawdown', 'moneydown',
+                 'maxlen', 'maxdrawdown', 'maxmoneydown',)
+
+    def __init__(self):
+        self.len = 0              # 현재 낙폭 기간
+        self.drawdown = 0.0       # 현재 낙폭 (백분율)
+        self.moneydown = 0.0      # 현재 낙폭 (금액)
+        self.maxlen = 0.0         # 최대 낙폭 기간
+        self.maxdrawdown = 0.0    # 최대 낙폭 (백분율)
+        self.maxmoneydown = 0.0   # 최대 낙폭 (금액)
+
+
 # =============================================================================
 # DrawDown 클래스 - 낙폭 분석기
 # =============================================================================
@@ -80,6 +95,13 @@ class DrawDown(bt.Analyzer):
         - ``max.drawdown`` - max drawdown value in 0.xx %
         - ``max.moneydown`` - max drawdown value in monetary units
         - ``max.len`` - max drawdown length
+
+    Attributes:
+
+      - ``ddstats``: the stats are updated during runs in this object, with
+        the attributes ``len``, ``drawdown``, ``moneydown``, ``maxlen``,
+        ``maxdrawdown`` and ``maxmoneydown``. The dictionary returned by
+        ``get_analysis`` is filled from it
     '''
 
     # =============================================================================
@@ -125,44 +147,68 @@ class DrawDown(bt.Analyzer):
         # =============================================================================
         # 내부 변수 초기화
         # =============================================================================
+        self.ddstats = _DrawDownStats()  # 바(bar)마다 갱신되는 낙폭 통계
         self._maxvalue = float('-inf')  # any value will outdo it (어떤 값보다도 작은 초기값)
 
+    def _fill_rets(self):
+        # 낙폭 통계 객체의 값을 분석 결과 딕셔너리에 기록
+        st, r = self.ddstats, self.rets
+        r.len = st.len
+        r.drawdown = st.drawdown
+        r.moneydown = st.moneydown
+
+        rmax = r.max
+        rmax.len = st.maxlen
+        rmax.drawdown = st.maxdrawdown
+        rmax.moneydown = st.maxmoneydown
+
+    def get_analysis(self):
+        # =============================================================================
+        # 분석 결과 반환 (실행 중 호출되어도 최신 값이 반영됨)
+        # =============================================================================
+        self._fill_rets()
+        return self.rets
+
     def stop(self):
         # =============================================================================
         # 분석기 종료 시 정리
         # =============================================================================
+        self._fill_rets()
         self.rets._close()  # . notation cannot create more keys (점 표기법으로 더 이상 키 생성 불가)
 
     def notify_fund(self, cash, value, fundvalue, shares):
         # =============================================================================
         # 자금 상태 알림 처리
         # =============================================================================
-        # 펀드 모드에 따라 현재 가치와 최대 가치를 업데이트
-        if not self._fundmode:
-            # 펀드 모드가 아닌 경우: 총 순자산 가치 사용
-            self._value = value  # record current value (현재 가치 기록)
-            self._maxvalue = max(self._maxvalue, value)  # update peak value (최고점 업데이트)
-        else:
-            # 펀드 모드인 경우: 펀드 가치 사용
-            self._value = fundvalue  # record current value (현재 펀드 가치 기록)
-            self._maxvalue = max(self._maxvalue, fundvalue)  # update peak (최고점 업데이트)
+        # 펀드 모드에 따라 사용할 가치를 고른 뒤 현재 가치와 최대 가치를 한 번에 업데이트
+        # (펀드 모드가 아닌 경우: 총 순자산 가치, 펀드 모드인 경우: 펀드 가치)
+        if self._fundmode:
+            value = fundvalue
+
+        self._value = value  # record current value (현재 가치 기록)
+        if value > self._maxvalue:
+            self._maxvalue = value  # update peak value (최고점 업데이트)
 
     def next(self):
         # =============================================================================
         # 각 거래일마다 낙폭 계산
         # =============================================================================
-        r = self.rets
+        st = self.ddstats
 
         # calculate current drawdown values
-        r.moneydown = moneydown = self._maxvalue - self._value
-        r.drawdown = drawdown = 100.0 * moneydown / self._maxvalue
-
-        # maxximum drawdown values
-        r.max.moneydown = max(r.max.moneydown, moneydown)
-        r.max.drawdown = maxdrawdown = max(r.max.drawdown, drawdown)
+        maxvalue = self._maxvalue
+        st.moneydown = moneydown = maxvalue - self._value
+        st.drawdown = drawdown = 100.0 * moneydown / maxvalue
+        st.len = ddlen = st.len + 1 if drawdown else 0
 
-        r.len = r.len + 1 if drawdown else 0
-        r.max.len = max(r.max.len, r.len)
+        # maxximum drawdown values - only written when they change
+        # (비교 후 변경된 경우에만 기록하여 max() 호출과 불필요한 쓰기를 제거)
+        if moneydown > st.maxmoneydown:
+            st.maxmoneydown = moneydown
+        if drawdown > st.maxdrawdown:
+            st.maxdrawdown = drawdown
+        if ddlen > st.maxlen:
+            st.maxlen = ddlen
 
 
 # =============================================================================
@@ -235,7 +281,14 @@ class TimeDrawDown(bt.TimeFrameAnalyzerBase):
         else:
             # 사용자가 명시적으로 설정한 펀드 모드 사용
             self._fundmode = self.p.fund
-            
+
+        # 펀드 모드는 시작 후 바뀌지 않으므로 가치 조회 메서드를 미리 선택
+        broker = self.strategy.broker
+        if not self._fundmode:
+            self._getvalue = broker.getvalue  # 총 순자산 가치 사용
+        else:
+            self._getvalue = broker.get_fundvalue  # 펀드 가치 사용
+
         # =============================================================================
         # 낙폭 추적 변수 초기화
         # =============================================================================
@@ -249,37 +302,33 @@ class TimeDrawDown(bt.TimeFrameAnalyzerBase):
         # =============================================================================
         # 시간 프레임 경계에서 낙폭 계산
         # =============================================================================
-        if not self._fundmode:
-            # 펀드 모드가 아닌 경우: 총 순자산 가치 사용
-            value = self.strategy.broker.getvalue()
-        else:
-            # 펀드 모드인 경우: 펀드 가치 사용
-            value = self.strategy.broker.fundvalue
+        value = self._getvalue()  # start 에서 펀드 모드에 따라 선택된 메서드
 
         # =============================================================================
-        # 최고점 업데이트 및 낙폭 기간 초기화
+        # 낙폭 상태를 지역 변수로 읽어서 한 번에 갱신
         # =============================================================================
+        peak, ddlen = self.peak, self.ddlen
+
         # update the maximum seen peak
         # 지금까지 본 최고점 업데이트
-        if value > self.peak:
-            self.peak = value
-            self.ddlen = 0  # start of streak (연속 기간 시작)
+        if value > peak:
+            peak = value
+            ddlen = 0  # start of streak (연속 기간 시작)
 
-        # =============================================================================
-        # 현재 낙폭 계산
-        # =============================================================================
         # calculate the current drawdown
         # 현재 낙폭 계산
-        self.dd = dd = 100.0 * (self.peak - value) / self.peak
-        self.ddlen += bool(dd)  # if peak == value -> dd = 0 (최고점과 같으면 낙폭 0)
+        dd = 100.0 * (peak - value) / peak
+        ddlen += dd != 0.0  # if peak == value -> dd = 0 (최고점과 같으면 낙폭 0)
+
+        # 갱신된 상태를 한 번에 기록
+        self.peak, self.ddlen, self.dd = peak, ddlen, dd
 
-        # =============================================================================
-        # 최대 낙폭 및 최대 낙폭 기간 업데이트
-        # =============================================================================
         # update the maxdrawdown if needed
-        # 필요시 최대 낙폭 업데이트
-        self.maxdd = max(self.maxdd, dd)
-        self.maxddlen = max(self.maxddlen, self.ddlen)
+        # 필요시 최대 낙폭 및 최대 낙폭 기간 업데이트 (max() 호출 없이 비교 후 기록)
+        if dd > self.maxdd:
+            self.maxdd = dd
+        if ddlen > self.maxddlen:
+            self.maxddlen = ddlen
 
     def stop(self):
         # =============================================================================
@@ -41,6 +41,8 @@
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 
+import array
+
 import backtrader as bt
 
 
@@ -90,12 +92,19 @@ class GrossLeverage(bt.Analyzer):
             # 사용자가 명시적으로 설정한 펀드 모드 사용
             self._fundmode = self.p.fund
 
+        # 결과를 열 단위로 저장: 원시 날짜/시간 값 배열과 레버리지 값 배열
+        # 날짜/시간 객체로의 변환은 get_analysis 에서 한꺼번에 수행
+        self._dtline = self.data0.datetime
+        self._dtnums = array.array(str('d'))
+        self._levs = array.array(str('d'))
+        self._nrows = 0  # 결과 딕셔너리에 이미 반영된 행의 수
+
     def notify_fund(self, cash, value, fundvalue, shares):
         # =============================================================================
         # 자금 상태 알림 처리
         # =============================================================================
         self._cash = cash  # 현금 보유량 저장
-        
+
         if not self._fundmode:
             # 펀드 모드가 아닌 경우: 총 순자산 가치 사용
             self._value = value
@@ -113,9 +122,20 @@ class GrossLeverage(bt.Analyzer):
         # 0.0: 100% 현금 보유, 1.0: 숏 포지션 없이 완전 투자
         
         # =============================================================================
-        # 레버리지 공식: (총 가치 - 현금) / 총 가치
+        # 레버리지 공식: (총 가치 - 현금) / 총 가치 = 1 - 현금 / 총 가치
         # =============================================================================
-        lev = (self._value - self._cash) / self._value
-        
-        # 현재 날짜/시간을 키로 하여 레버리지 값 저장
-        self.rets[self.data0.datetime.datetime()] = lev
+        # 현재 날짜/시간과 레버리지 값을 각각의 열에 추가
+        self._dtnums.append(self._dtline[0])
+        self._levs.append(1.0 - self._cash / self._value)
+
+    def get_analysis(self):
+        # =============================================================================
+        # 아직 반영되지 않은 행들을 결과 딕셔너리에 추가한 후 반환
+        # =============================================================================
+        dtnums, levs = self._dtnums, self._levs
+        tz = self._dtline._tz
+        for i in range(self._nrows, len(dtnums)):
+            self.rets[bt.num2date(dtnums[i], tz=tz)] = levs[i]
+
+        self._nrows = len(dtnums)
+        return self.rets
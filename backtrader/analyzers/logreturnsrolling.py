@@ -41,7 +41,7 @@
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 
-import collections
+import array
 import math
 
 import backtrader as bt
@@ -141,12 +141,16 @@ class LogReturnsRolling(bt.TimeFrameAnalyzerBase):
             self._fundmode = self.p.fund
 
         # =============================================================================
-        # 값 저장을 위한 덱 초기화
+        # 값 저장을 위한 링 버퍼 초기화
         # =============================================================================
-        # 압축 비율만큼 NaN 값으로 초기화된 덱 생성
-        # maxlen으로 최대 크기 제한하여 메모리 효율성 확보
-        self._values = collections.deque([float('Nan')] * self.compression,
-                                         maxlen=self.compression)
+        # 압축 비율만큼 NaN 값으로 미리 할당된 배열('d')과 쓰기 위치 인덱스
+        # (쓰기 위치는 항상 가장 오래된 값을 가리키므로 덱처럼 값을 밀어낼 필요가 없음)
+        self._values = array.array(str('d'), [float('Nan')]) * self.compression
+        self._head = 0
+
+        # 추적 데이터는 시작 후 바뀌지 않으므로 속성으로 저장해
+        # notify_fund 에서 매번 파라미터를 조회하지 않음
+        self._trackdata = self.p.data
 
         if self.p.data is None:
             # =============================================================================
@@ -163,12 +167,15 @@ class LogReturnsRolling(bt.TimeFrameAnalyzerBase):
         # =============================================================================
         # 자금 상태 알림 처리
         # =============================================================================
-        if not self._fundmode:
-            # 펀드 모드가 아닌 경우
-            self._value = value if self.p.data is None else self.p.data[0]
+        if self._trackdata is not None:
+            # 데이터를 추적하는 경우: 데이터의 현재 값 사용
+            self._value = self._trackdata[0]
+        elif self._fundmode:
+            # 펀드 모드인 경우: 펀드 가치 사용
+            self._value = fundvalue
         else:
-            # 펀드 모드인 경우
-            self._value = fundvalue if self.p.data is None else self.p.data[0]
+            # 펀드 모드가 아닌 경우: 총 순자산 가치 사용
+            self._value = value
 
     def _on_dt_over(self):
         # =============================================================================
@@ -194,7 +201,11 @@ class LogReturnsRolling(bt.TimeFrameAnalyzerBase):
         # =============================================================================
         # 값 저장 및 업데이트
         # =============================================================================
-        self._values.append(vst)  # push values backwards (and out) (값을 뒤로 밀어넣고 오래된 값 제거)
+        # 가장 오래된 값을 덮어쓰고 쓰기 위치를 전진
+        head = self._head
+        self._values[head] = vst  # overwrite the oldest value (가장 오래된 값 덮어쓰기)
+        head += 1
+        self._head = head if head < self.compression else 0
 
     def next(self):
         # =============================================================================
@@ -210,7 +221,9 @@ class LogReturnsRolling(bt.TimeFrameAnalyzerBase):
         # =============================================================================
         # 로그 수익률은 복합 수익률 계산에 더 정확하며,
         # 연속된 수익률의 합이 전체 기간 수익률과 일치합니다.
-        self.rets[self.dtkey] = math.log(self._value / self._values[0])
+        # log(value / v0) 를 상대 변화의 log1p 로 계산: 작은 변화에서 더 정확함
+        v0 = self._values[self._head]
+        self.rets[self.dtkey] = math.log1p((self._value - v0) / v0)
         
         # =============================================================================
         # 마지막 값 업데이트
@@ -128,21 +128,37 @@ class PeriodStats(bt.Analyzer):
         # 분석기 종료 시 통계 계산
         # =============================================================================
         trets = self._tr.get_analysis()  # dict key = date, value = ret (딕셔너리: 키=날짜, 값=수익률)
-        pos = nul = neg = 0  # 양수, 무변화, 음수 기간 수 초기화
-        
+
         # =============================================================================
         # 수익률 값들을 리스트로 변환
         # =============================================================================
         trets = list(itervalues(trets))
-        
+
         # =============================================================================
-        # 각 기간별 수익률을 분류하여 카운트
+        # 각 기간별 수익률을 부호에 따라 분류하여 카운트
         # =============================================================================
+        # 한 번의 순회로 양수/음수/무변화 개수를 함께 셈
+        pos = nul = neg = 0  # 양수, 무변화, 음수 기간 수 초기화
         for tret in trets:
             if tret > 0.0:
                 pos += 1  # 양수 수익률 기간
             elif tret < 0.0:
                 neg += 1  # 음수 수익률 기간
-            else:
-                if self.p.zeroispos:
-                    pos += tret == 0.0  # 무변화를 양수로 계산하는 경우
\ No newline at end of file
+            elif tret == 0.0:
+                nul += 1  # 무변화 기간
+
+        if self.p.zeroispos:
+            pos, nul = pos + nul, 0  # 무변화를 양수로 계산하는 경우
+
+        # =============================================================================
+        # 통계 결과 저장
+        # =============================================================================
+        self.rets['average'] = avg = average(trets)       # 평균 수익률
+        self.rets['stddev'] = standarddev(trets, avg)     # 수익률 표준편차
+
+        self.rets['positive'] = pos    # 양수 수익률 기간 수
+        self.rets['negative'] = neg    # 음수 수익률 기간 수
+        self.rets['nochange'] = nul    # 무변화 기간 수
+
+        self.rets['best'] = max(trets)   # 최고 수익률
+        self.rets['worst'] = min(trets)  # 최저 수익률
@@ -36,6 +36,7 @@
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 
+import array
 
 import backtrader as bt
 
@@ -108,23 +109,50 @@ class PositionsValue(bt.Analyzer):
         # 일별 이상의 시간 프레임인 경우 날짜 사용, 그렇지 않으면 시간 사용
         self._usedate = tf >= bt.TimeFrame.Days
 
+        # =============================================================================
+        # 열(column) 단위 결과 저장소 초기화
+        # =============================================================================
+        # 바마다 리스트를 만드는 대신 날짜 키와 자산별 가치를 각각의 열에 저장하고
+        # get_analysis 가 호출될 때 결과 딕셔너리를 만듦
+        # 날짜 키는 원시 float 값으로 저장하고 get_analysis 에서 한꺼번에 변환
+        self._dtline = self.strategy.datetime
+        self._dtnums = array.array(str('d'))
+        self._columns = [array.array(str('d'))
+                         for _ in range(len(self.datas) + self.p.cash)]
+        self._nrows = 0  # 결과 딕셔너리에 이미 반영된 행의 수
+
     def next(self):
         # =============================================================================
         # 각 거래일마다 포지션 가치 수집
         # =============================================================================
-        # 각 데이터 피드의 포지션 가치를 브로커에서 가져오기
-        pvals = [self.strategy.broker.get_value([d]) for d in self.datas]
-        
+        # 모든 데이터 피드의 포지션 가치를 브로커에서 한 번에 가져오기
+        broker = self.strategy.broker
+        columns = self._columns
+        for value, column in zip(broker.get_values_by_data(self.datas),
+                                 columns):
+            column.append(value)
+
         if self.p.cash:
             # 현금 포함 옵션이 활성화된 경우 현금 가치 추가
-            pvals.append(self.strategy.broker.get_cash())
+            columns[-1].append(broker.get_cash())
 
+        # 결과 키는 원시 float 값으로 저장 (변환은 get_analysis 에서 수행)
+        self._dtnums.append(self._dtline[0])
+
+    def get_analysis(self):
         # =============================================================================
-        # 결과 저장
+        # 아직 반영되지 않은 행들을 결과 딕셔너리에 추가한 후 반환
         # =============================================================================
+        dtnums, columns = self._dtnums, self._columns
+        tz = self._dtline._tz
+        # 날짜/시간 키 변환 방식은 행마다가 아니라 호출마다 한 번만 결정
+        dtkeys = (bt.num2date(x, tz=tz) for x in dtnums[self._nrows:])
         if self._usedate:
             # 일별 이상의 시간 프레임: 날짜를 키로 사용
-            self.rets[self.strategy.datetime.date()] = pvals
-        else:
-            # 시간 단위의 시간 프레임: 날짜와 시간을 키로 사용
-            self.rets[self.strategy.datetime.datetime()] = pvals
+            dtkeys = (dt.date() for dt in dtkeys)
+
+        for i, dtkey in enumerate(dtkeys, self._nrows):
+            self.rets[dtkey] = [column[i] for column in columns]
+
+        self._nrows = len(dtnums)
+        return self.rets
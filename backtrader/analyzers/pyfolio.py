@@ -33,18 +33,30 @@
 # - PyFolio의 표준 데이터 형식으로 결과 변환
 # =============================================================================
 
-from __future__ import (absolute_import, division, print_function,
-                        unicode_literals)
-
-
 import collections
 
 import backtrader as bt
-from backtrader.utils.py3 import items, iteritems
 
 from . import TimeReturn, PositionsValue, Transactions, GrossLeverage
 
 
+def _columns_frame(index, columns, cols):
+    '''Builds a DataFrame from the ``index`` values and the value ``columns``.
+    The first entry in ``cols`` names the index, which is a UTC
+    ``DatetimeIndex``'''
+    import pandas  # only reached from get_pf_items, which requires pandas
+
+    dtindex = pandas.DatetimeIndex(index, tz='UTC', name=cols[0])
+    if not index:
+        # 행이 없는 경우 (예: 거래 없음): 열 데이터 없이 바로 생성
+        # from_records 와 같이 object 타입의 빈 열을 가짐
+        return pandas.DataFrame(index=dtindex, columns=cols[1:], dtype=object)
+
+    # 열 단위 데이터로 생성: 각 열의 타입은 한 번씩만 추론됨
+    return pandas.DataFrame(dict(zip(cols[1:], columns)), index=dtindex,
+                            columns=cols[1:])
+
+
 # =============================================================================
 # PyFolio 클래스 - PyFolio 통합 분석기
 # =============================================================================
@@ -158,20 +170,22 @@ class PyFolio(bt.Analyzer):
         # =============================================================================
         # keep import local to avoid disturbing installations with no pandas
         # pandas가 없는 설치 환경을 방해하지 않기 위해 로컬 임포트 유지
+        import numpy as np  # guaranteed by pandas
         import pandas
-        from pandas import DataFrame as DF
 
         # =============================================================================
         # 수익률 데이터 변환
         # =============================================================================
         # Returns
         # 수익률
+        # 단일 열이므로 DataFrame 을 거치지 않고 Series 를 직접 생성
+        rss = self.rets['returns']
         cols = ['index', 'return']
-        returns = DF.from_records(iteritems(self.rets['returns']),
-                                  index=cols[0], columns=cols)
-        returns.index = pandas.to_datetime(returns.index)
-        returns.index = returns.index.tz_localize('UTC')
-        rets = returns['return']
+        rets = pandas.Series(np.fromiter(rss.values(), dtype=np.float64,
+                                         count=len(rss)),
+                             index=pandas.DatetimeIndex(list(rss), tz='UTC',
+                                                        name=cols[0]),
+                             name=cols[1])
         
         # =============================================================================
         # 포지션 데이터 변환
@@ -179,11 +193,18 @@ class PyFolio(bt.Analyzer):
         # Positions
         # 포지션들
         pss = self.rets['positions']
-        ps = [[k] + v[-2:] for k, v in iteritems(pss)]
-        cols = ps.pop(0)  # headers are in the first entry (헤더는 첫 번째 항목에 있음)
-        positions = DF.from_records(ps, index=cols[0], columns=cols)
-        positions.index = pandas.to_datetime(positions.index)
-        positions.index = positions.index.tz_localize('UTC')
+        psit = iter(pss.items())
+        k, v = next(psit)
+        cols = [k] + v[-2:]  # headers are in the first entry (헤더는 첫 번째 항목에 있음)
+        # pop(0) 으로 리스트를 밀어내지 않고 헤더 다음 항목부터 열 단위로 수집
+        index = list()
+        columns = [list() for _ in cols[1:]]
+        for k, v in psit:
+            index.append(k)
+            for column, value in zip(columns, v[-2:]):
+                column.append(value)
+
+        positions = _columns_frame(index, columns, cols)
 
         # =============================================================================
         # 거래 내역 데이터 변환
@@ -191,7 +212,9 @@ class PyFolio(bt.Analyzer):
         # Transactions
         # 거래 내역들
         txss = self.rets['transactions']
-        txs = list()
+        txit = iter(txss.items())
+        k, v = next(txit)
+        cols = [k] + v[0]  # headers are in the first entry (헤더는 첫 번째 항목에 있음)
         # =============================================================================
         # 거래 내역 구조 설명:
         # 거래들은 공통 키(날짜)를 가지며 여러 자산에 대해 발생할 수 있습니다.
@@ -203,27 +226,29 @@ class PyFolio(bt.Analyzer):
         # for several assets. The dictionary has a single key and a list of
         # lists. Each sublist contains the fields of a transaction
         # Hence the double loop to undo the list indirection
-        for k, v in iteritems(txss):
-            for v2 in v:
-                txs.append([k] + v2)
+        # 행을 만들지 않고 날짜 키는 거래 수만큼 한 번에 확장하고
+        # 각 필드는 날짜별로 전치하여 해당 열에 추가 (헤더만 있으면 루프 없음)
+        index = list()
+        columns = [list() for _ in cols[1:]]
+        for k, v in txit:
+            index.extend([k] * len(v))
+            for column, fields in zip(columns, zip(*v)):
+                column.extend(fields)
 
-        cols = txs.pop(0)  # headers are in the first entry (헤더는 첫 번째 항목에 있음)
-        transactions = DF.from_records(txs, index=cols[0], columns=cols)
-        transactions.index = pandas.to_datetime(transactions.index)
-        transactions.index = transactions.index.tz_localize('UTC')
+        transactions = _columns_frame(index, columns, cols)
 
         # =============================================================================
         # 총 레버리지 데이터 변환
         # =============================================================================
         # Gross Leverage
         # 총 레버리지
+        gls = self.rets['gross_lev']
         cols = ['index', 'gross_lev']
-        gross_lev = DF.from_records(iteritems(self.rets['gross_lev']),
-                                    index=cols[0], columns=cols)
-
-        gross_lev.index = pandas.to_datetime(gross_lev.index)
-        gross_lev.index = gross_lev.index.tz_localize('UTC')
-        glev = gross_lev['gross_lev']
+        glev = pandas.Series(np.fromiter(gls.values(), dtype=np.float64,
+                                         count=len(gls)),
+                             index=pandas.DatetimeIndex(list(gls), tz='UTC',
+                                                        name=cols[0]),
+                             name=cols[1])
 
         # =============================================================================
         # 모든 데이터를 함께 반환
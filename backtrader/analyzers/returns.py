@@ -31,9 +31,6 @@
 # - 연간화된 수익률 계산으로 다른 전략과의 비교 가능
 # =============================================================================
 
-from __future__ import (absolute_import, division, print_function,
-                        unicode_literals)
-
 import math
 
 import backtrader as bt
@@ -139,18 +136,29 @@ class Returns(TimeFrameAnalyzerBase):
             # 사용자가 명시적으로 설정한 펀드 모드 사용
             self._fundmode = self.p.fund
 
+        # 펀드 모드는 시작 후 바뀌지 않으므로 가치 조회 메서드를 미리 선택
+        broker = self.strategy.broker
+        if not self._fundmode:
+            self._getvalue = broker.getvalue  # 총 순자산 가치 사용
+        else:
+            self._getvalue = broker.get_fundvalue  # 펀드 가치 사용
+
         # =============================================================================
         # 시작 가치 설정
         # =============================================================================
-        if not self._fundmode:
-            # 펀드 모드가 아닌 경우: 총 순자산 가치 사용
-            self._value_start = self.strategy.broker.getvalue()
-        else:
-            # 펀드 모드인 경우: 펀드 가치 사용
-            self._value_start = self.strategy.broker.fundvalue
+        self._value_start = self._getvalue()
 
         self._tcount = 0  # 하위 기간 카운터 초기화
 
+        # =============================================================================
+        # 연간화 기간 수 결정 (실행 중 바뀌지 않으므로 시작 시 한 번만 계산)
+        # =============================================================================
+        tann = self.p.tann or self._TANN.get(self.timeframe, None)
+        if tann is None:
+            tann = self._TANN.get(self.data._timeframe, 1.0)  # assign default
+
+        self._tann = tann
+
     def stop(self):
         # =============================================================================
         # 분석기 종료 시 최종 수익률 계산
@@ -160,24 +168,19 @@ class Returns(TimeFrameAnalyzerBase):
         # =============================================================================
         # 종료 가치 설정
         # =============================================================================
-        if not self._fundmode:
-            # 펀드 모드가 아닌 경우: 총 순자산 가치 사용
-            self._value_end = self.strategy.broker.getvalue()
-        else:
-            # 펀드 모드인 경우: 펀드 가치 사용
-            self._value_end = self.strategy.broker.fundvalue
+        self._value_end = self._getvalue()
 
         # =============================================================================
         # 복합 수익률 계산 (로그 수익률)
         # =============================================================================
         # Compound return
         # 복합 수익률
-        try:
-            nlrtot = self._value_end / self._value_start
-        except ZeroDivisionError:
+        # 예외 처리 대신 명시적인 분기로 0 나누기와 음수/0 비율을 처리
+        if not self._value_start:
             rtot = float('-inf')
         else:
-            if nlrtot < 0.0:
+            nlrtot = self._value_end / self._value_start
+            if nlrtot <= 0.0:
                 rtot = float('-inf')
             else:
                 rtot = math.log(nlrtot)
@@ -196,12 +199,8 @@ class Returns(TimeFrameAnalyzerBase):
         # =============================================================================
         # Annualized normalized return
         # 연간화된 정규화 수익률
-        tann = self.p.tann or self._TANN.get(self.timeframe, None)
-        if tann is None:
-            tann = self._TANN.get(self.data._timeframe, 1.0)  # assign default
-
         if ravg > float('-inf'):
-            self.rets['rnorm'] = rnorm = math.expm1(ravg * tann)
+            self.rets['rnorm'] = rnorm = math.expm1(ravg * self._tann)
         else:
             self.rets['rnorm'] = rnorm = ravg
 
@@ -35,13 +35,8 @@
 # - 연간화 옵션 제공
 # =============================================================================
 
-from __future__ import (absolute_import, division, print_function,
-                        unicode_literals)
-
 import math
 
-from backtrader.utils.py3 import itervalues
-
 from backtrader import Analyzer, TimeFrame
 from backtrader.mathsupport import average, standarddev
 from backtrader.analyzers import TimeReturn, AnnualReturn
@@ -167,6 +162,28 @@ class SharpeRatio(Analyzer):
                 compression=self.p.compression,
                 fund=self.p.fund)
 
+        # =============================================================================
+        # 변환 계수 결정 (파라미터에만 의존하므로 생성 시 한 번만 계산)
+        # =============================================================================
+        factor = None
+
+        # Hack to identify old code
+        # 구 코드 식별을 위한 해킹
+        if self.p.timeframe == TimeFrame.Days and \
+           self.p.daysfactor is not None:
+
+            factor = self.p.daysfactor
+
+        else:
+            if self.p.factor is not None:
+                factor = self.p.factor  # user specified factor (사용자 지정 계수)
+            elif self.p.timeframe in self.RATEFACTORS:
+                # Get the conversion factor from the default table
+                # 기본 테이블에서 변환 계수 가져오기
+                factor = self.RATEFACTORS[self.p.timeframe]
+
+        self._factor = factor
+
     def stop(self):
         # =============================================================================
         # 분석기 종료 시 샤프 비율 계산
@@ -187,29 +204,10 @@ class SharpeRatio(Analyzer):
             # =============================================================================
             # Get the returns from the subanalyzer
             # 하위 분석기에서 수익률 가져오기
-            returns = list(itervalues(self.timereturn.get_analysis()))
+            returns = list(self.timereturn.get_analysis().values())
 
             rate = self.p.riskfreerate  # 무위험 수익률
-
-            factor = None
-
-            # =============================================================================
-            # 변환 계수 결정
-            # =============================================================================
-            # Hack to identify old code
-            # 구 코드 식별을 위한 해킹
-            if self.p.timeframe == TimeFrame.Days and \
-               self.p.daysfactor is not None:
-
-                factor = self.p.daysfactor
-
-            else:
-                if self.p.factor is not None:
-                    factor = self.p.factor  # user specified factor (사용자 지정 계수)
-                elif self.p.timeframe in self.RATEFACTORS:
-                    # Get the conversion factor from the default table
-                    # 기본 테이블에서 변환 계수 가져오기
-                    factor = self.RATEFACTORS[self.p.timeframe]
+            factor = self._factor  # __init__ 에서 결정된 변환 계수
 
             if factor is not None:
                 # =============================================================================
@@ -245,10 +243,13 @@ class SharpeRatio(Analyzer):
                 # =============================================================================
                 # Get the excess returns - arithmetic mean - original sharpe
                 # 초과 수익률 가져오기 - 산술 평균 - 원본 샤프
-                ret_free = [r - rate for r in returns]
-                ret_free_avg = average(ret_free)
-                retdev = standarddev(ret_free, avgx=ret_free_avg,
-                                     bessel=self.p.stddev_sample)
+                # 초과 수익률 리스트와 분산 리스트를 만들지 않고
+                # 평균과 표준편차를 각각 한 번의 순회로 계산 (fsum 정밀도 유지)
+                nrets = len(returns)
+                ret_free_avg = math.fsum(r - rate for r in returns) / nrets
+                retvar = math.fsum(pow(r - rate - ret_free_avg, 2.0)
+                                   for r in returns)
+                retdev = math.sqrt(retvar / (nrets - self.p.stddev_sample))
 
                 try:
                     ratio = ret_free_avg / retdev
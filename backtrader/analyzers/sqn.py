@@ -41,10 +41,10 @@
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 
+import array
 import math
 
 from backtrader import Analyzer
-from backtrader.mathsupport import average, standarddev
 from backtrader.utils import AutoOrderedDict
 
 
@@ -97,16 +97,27 @@ class SQN(Analyzer):
         # 분석기 시작 시 초기화
         # =============================================================================
         super(SQN, self).start()
-        self.pnl = list()  # 거래별 수익/손실을 저장할 리스트
+        self.pnl = array.array(str('d'))  # 거래별 수익/손실을 저장할 배열
         self.count = 0     # 완료된 거래 수 카운터
 
+        # Welford 방식의 온라인 평균/편차제곱합 누적값
+        # (종료 시 배열을 다시 순회하지 않고 통계값을 바로 얻기 위함)
+        self._mean = 0.0
+        self._m2 = 0.0
+
     def notify_trade(self, trade):
         # =============================================================================
         # 거래 완료 알림 처리
         # =============================================================================
         if trade.status == trade.Closed:  # 거래가 완전히 종료되었을 때
-            self.pnl.append(trade.pnlcomm)  # 수수료 포함 수익/손실을 리스트에 추가
-            self.count += 1                  # 거래 수 증가
+            pnlcomm = trade.pnlcomm
+            self.pnl.append(pnlcomm)  # 수수료 포함 수익/손실을 배열에 추가
+            self.count = count = self.count + 1  # 거래 수 증가
+
+            # 평균과 편차제곱합을 Welford 방식으로 갱신
+            delta = pnlcomm - self._mean
+            self._mean = mean = self._mean + delta / count
+            self._m2 += delta * (pnlcomm - mean)
 
     def stop(self):
         # =============================================================================
@@ -116,18 +127,19 @@ class SQN(Analyzer):
             # =============================================================================
             # SQN 계산을 위한 통계값 계산
             # =============================================================================
-            pnl_av = average(self.pnl)      # 거래 수익률의 평균
-            pnl_stddev = standarddev(self.pnl)  # 거래 수익률의 표준편차
-            
-            try:
-                # =============================================================================
-                # SQN 공식 적용
-                # =============================================================================
-                # SQN = √(거래 수) × 평균 거래 수익률 / 거래 수익률의 표준편차
-                sqn = math.sqrt(len(self.pnl)) * pnl_av / pnl_stddev
-            except ZeroDivisionError:
+            # 거래마다 누적한 값에서 바로 계산 (배열 재순회 없음)
+            pnl_av = self._mean  # 거래 수익률의 평균
+            pnl_stddev = math.sqrt(self._m2 / self.count)  # 거래 수익률의 표준편차
+
+            # =============================================================================
+            # SQN 공식 적용
+            # =============================================================================
+            # SQN = √(거래 수) × 평균 거래 수익률 / 거래 수익률의 표준편차
+            if pnl_stddev == 0.0:
                 # 표준편차가 0인 경우 (모든 거래가 동일한 수익률)
                 sqn = None
+            else:
+                sqn = math.sqrt(self.count) * pnl_av / pnl_stddev
         else:
             # 거래가 1개 이하인 경우 SQN을 0으로 설정
             sqn = 0
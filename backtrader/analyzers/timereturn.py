@@ -127,6 +127,10 @@ class TimeReturn(TimeFrameAnalyzerBase):
             # 사용자가 명시적으로 설정한 펀드 모드 사용
             self._fundmode = self.p.fund
 
+        # 추적 데이터는 시작 후 바뀌지 않으므로 속성으로 저장해
+        # notify_fund 에서 매번 파라미터를 조회하지 않음
+        self._trackdata = self.p.data
+
         self._value_start = 0.0
         self._lastvalue = None
         if self.p.data is None:
@@ -137,17 +141,13 @@ class TimeReturn(TimeFrameAnalyzerBase):
                 self._lastvalue = self.strategy.broker.fundvalue
 
     def notify_fund(self, cash, value, fundvalue, shares):
-        if not self._fundmode:
-            # Record current value
-            if self.p.data is None:
-                self._value = value  # the portofolio value if tracking no data
-            else:
-                self._value = self.p.data[0]  # the data value if tracking data
+        # Record current value
+        if self._trackdata is not None:
+            self._value = self._trackdata[0]  # the data value if tracking data
+        elif self._fundmode:
+            self._value = fundvalue  # the fund value if tracking no data
         else:
-            if self.p.data is None:
-                self._value = fundvalue  # the fund value if tracking no data
-            else:
-                self._value = self.p.data[0]  # the data value if tracking data
+            self._value = value  # the portofolio value if tracking no data
 
     def on_dt_over(self):
         # next is called in a new timeframe period
@@ -165,5 +165,6 @@ class TimeReturn(TimeFrameAnalyzerBase):
     def next(self):
         # Calculate the return
         super(TimeReturn, self).next()
-        self.rets[self.dtkey] = (self._value / self._value_start) - 1.0
-        self._lastvalue = self._value  # keep last value
+        value = self._value
+        self.rets[self.dtkey] = (value / self._value_start) - 1.0
+        self._lastvalue = value  # keep last value
@@ -36,13 +36,31 @@
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 
-import sys
-
 from backtrader import Analyzer
-from backtrader.utils import AutoOrderedDict, AutoDict
+from backtrader.utils import AutoOrderedDict
 from backtrader.utils.py3 import MAXINT
 
 
+# =============================================================================
+# _TradeStats 클래스 - 거래 그룹 통계 저장 객체
+# =============================================================================
+# 완료된 거래마다 갱신되는 합계/횟수/최대/최소값을 __slots__ 속성으로 보관합니다.
+# 분석 결과 딕셔너리는 결과를 요청할 때 이 객체들로부터 채워집니다.
+class _TradeStats(object):
+    __slots__ = ('total', 'pnl', 'pnlmax', 'barlen', 'barlenmax', 'barlenmin',
+                 'current', 'longest',)
+
+    def __init__(self):
+        self.total = 0             # 거래 수
+        self.pnl = 0.0             # 순손익 합계 (수수료 포함)
+        self.pnlmax = 0.0          # 최대 수익 (손실 그룹은 최대 손실)
+        self.barlen = 0            # 시장 체류 기간 합계
+        self.barlenmax = 0         # 최대 시장 체류 기간
+        self.barlenmin = MAXINT    # 최소 시장 체류 기간 (MAXINT: 아직 없음)
+        self.current = 0           # 현재 연속 횟수
+        self.longest = 0           # 최장 연속 횟수
+
+
 # =============================================================================
 # TradeAnalyzer 클래스 - 거래 통계 분석기
 # =============================================================================
@@ -85,7 +103,7 @@ class TradeAnalyzer(Analyzer):
         - dictname['total']['total'] which will have a value of 0 (the field is
           also reachable with dot notation dictname.total.total
     '''
-    
+
     def create_analysis(self):
         # =============================================================================
         # 분석 결과를 저장할 구조 생성
@@ -94,13 +112,111 @@ class TradeAnalyzer(Analyzer):
         self.rets = AutoOrderedDict()
         self.rets.total.total = 0  # 총 거래 수 초기화
 
+        # 거래 통계는 _TradeStats 객체에 누적되고 결과 요청 시 rets 에 기록됨
+        self._total = 0  # 시작된 거래 수
+        self._open = 0  # 진행 중인 거래 수
+        self._pnlgross = 0.0  # 총손익 합계 (수수료 제외)
+        self._all = _TradeStats()  # 완료된 모든 거래
+        self._wl = (_TradeStats(), _TradeStats())  # 수익/손실 거래
+        self._ls = (_TradeStats(), _TradeStats())  # 롱/숏 거래
+        self._lswl = ((_TradeStats(), _TradeStats()),  # 롱 수익/손실 거래
+                      (_TradeStats(), _TradeStats()))  # 숏 수익/손실 거래
+
     def stop(self):
         # =============================================================================
         # 분석기 종료 시 정리
         # =============================================================================
         super(TradeAnalyzer, self).stop()
+        self._fill_rets()
         self.rets._close()  # 점 표기법으로 더 이상 키 생성 불가
 
+    def get_analysis(self):
+        # 통계 객체의 값을 결과 딕셔너리에 기록 (실행 중 호출되어도 최신 값이 반영됨)
+        self._fill_rets()
+        return self.rets
+
+    def _fill_rets(self):
+        # =============================================================================
+        # 통계 객체의 값을 분석 결과 딕셔너리에 기록
+        # =============================================================================
+        # Keys are created in reporting order and only once trades have been
+        # opened/closed. Averages are derived here from totals and counters
+        # 키는 보고 순서대로, 거래가 시작/완료된 후에만 생성됨
+        # 평균은 합계와 횟수로부터 여기서 계산 (거래가 없는 쪽은 0.0)
+        trades = self.rets
+        trades.total.total = self._total
+        if not self._total:
+            return  # 거래가 없으면 total.total 만 존재
+
+        trades.total.open = self._open
+        tall = self._all
+        closed = tall.total
+        if not closed:
+            return  # 완료된 거래가 없으면 통계 키도 없음
+
+        trades.total.closed = closed
+
+        # 연속 성과(Streak)
+        for wlname, wl in zip(['won', 'lost'], self._wl):
+            trades.streak[wlname].current = wl.current
+            trades.streak[wlname].longest = wl.longest
+
+        # 총손익/순손익
+        trades.pnl.gross.total = self._pnlgross
+        trades.pnl.gross.average = self._pnlgross / closed
+        trades.pnl.net.total = tall.pnl
+        trades.pnl.net.average = tall.pnl / closed
+
+        # 승/패별 통계
+        for wlname, wl in zip(['won', 'lost'], self._wl):
+            trwl = trades[wlname]
+            trwl.total = wl.total
+            trwl.pnl.total = wl.pnl
+            trwl.pnl.average = wl.pnl / wl.total if wl.total else 0.0
+            trwl.pnl.max = wl.pnlmax
+
+        # 롱/숏별 통계
+        for lsname, ls, lswl in zip(['long', 'short'], self._ls, self._lswl):
+            trls = trades[lsname]
+            trls.total = ls.total
+            trls.pnl.total = ls.pnl
+            trls.pnl.average = ls.pnl / ls.total if ls.total else 0.0
+            for wlname, wl in zip(['won', 'lost'], lswl):
+                trls[wlname] = wl.total
+                trlspnl_wl = trls.pnl[wlname]
+                trlspnl_wl.total = wl.pnl
+                trlspnl_wl.average = wl.pnl / wl.total if wl.total else 0.0
+                trlspnl_wl.max = wl.pnlmax
+
+        # 거래 기간(Length)
+        trlen = trades.len
+        trlen.total = tall.barlen
+        trlen.average = tall.barlen / closed
+        trlen.max = tall.barlenmax
+        trlen.min = tall.barlenmin
+
+        for wlname, wl in zip(['won', 'lost'], self._wl):
+            trlen_wl = trlen[wlname]
+            trlen_wl.total = wl.barlen
+            trlen_wl.average = wl.barlen / wl.total if wl.total else 0.0
+            trlen_wl.max = wl.barlenmax
+            if wl.barlenmin != MAXINT:
+                # 기간이 있는 거래가 나타난 경우에만 최소값 생성
+                trlen_wl.min = wl.barlenmin
+
+        for lsname, ls, lswl in zip(['long', 'short'], self._ls, self._lswl):
+            trlen_ls = trlen[lsname]
+            trlen_ls.total = ls.barlen
+            trlen_ls.average = ls.barlen / ls.total if ls.total else 0.0
+            trlen_ls.max = ls.barlenmax
+            trlen_ls.min = ls.barlenmin
+            for wlname, wl in zip(['won', 'lost'], lswl):
+                trlen_wl = trlen_ls[wlname]
+                trlen_wl.total = wl.barlen
+                trlen_wl.average = wl.barlen / wl.total if wl.total else 0.0
+                trlen_wl.max = wl.barlenmax
+                trlen_wl.min = wl.barlenmin
+
     def notify_trade(self, trade):
         # =============================================================================
         # 거래 상태 변화 알림 처리
@@ -109,167 +225,76 @@ class TradeAnalyzer(Analyzer):
             # =============================================================================
             # 거래가 새로 열렸을 때
             # =============================================================================
-            self.rets.total.total += 1      # 총 거래 수 증가
-            self.rets.total.open += 1       # 진행 중인 거래 수 증가
+            self._total += 1  # 총 거래 수 증가
+            self._open += 1  # 진행 중인 거래 수 증가
 
         elif trade.status == trade.Closed:
             # =============================================================================
             # 거래가 완료되었을 때
             # =============================================================================
-            trades = self.rets
-
-            res = AutoDict()  # 이 거래의 결과를 저장할 딕셔너리
             # Trade just closed
+            self._open -= 1  # 진행 중인 거래 수 감소
 
             # =============================================================================
-            # 거래 결과 기본 정보 설정
-            # =============================================================================
-            won = res.won = int(trade.pnlcomm >= 0.0)      # 수익 거래 여부 (1: 수익, 0: 손실)
-            lost = res.lost = int(not won)                  # 손실 거래 여부 (1: 손실, 0: 수익)
-            tlong = res.tlong = trade.long                  # 롱 포지션 여부
-            tshort = res.tshort = not trade.long            # 숏 포지션 여부
-
-            # =============================================================================
-            # 거래 상태 업데이트
-            # =============================================================================
-            trades.total.open -= 1      # 진행 중인 거래 수 감소
-            trades.total.closed += 1    # 완료된 거래 수 증가
-
-            # =============================================================================
-            # 연속 성과(Streak) 계산
+            # 거래 결과 기본 정보
             # =============================================================================
-            for wlname in ['won', 'lost']:
-                wl = res[wlname]
-
-                trades.streak[wlname].current *= wl
-                trades.streak[wlname].current += wl
-
-                ls = trades.streak[wlname].longest or 0
-                trades.streak[wlname].longest = \
-                    max(ls, trades.streak[wlname].current)
-
-            trpnl = trades.pnl
-            trpnl.gross.total += trade.pnl
-            trpnl.gross.average = trades.pnl.gross.total / trades.total.closed
-            trpnl.net.total += trade.pnlcomm
-            trpnl.net.average = trades.pnl.net.total / trades.total.closed
-
-            # Won/Lost statistics
-            for wlname in ['won', 'lost']:
-                wl = res[wlname]
-                trwl = trades[wlname]
-
-                trwl.total += wl  # won.total / lost.total
-
-                trwlpnl = trwl.pnl
-                pnlcomm = trade.pnlcomm * wl
-
-                trwlpnl.total += pnlcomm
-                trwlpnl.average = trwlpnl.total / (trwl.total or 1.0)
-
-                wm = trwlpnl.max or 0.0
-                func = max if wlname == 'won' else min
-                trwlpnl.max = func(wm, pnlcomm)
-
-            # Long/Short statistics
-            for tname in ['long', 'short']:
-                trls = trades[tname]
-                ls = res['t' + tname]
-
-                trls.total += ls  # long.total / short.total
-                trls.pnl.total += trade.pnlcomm * ls
-                trls.pnl.average = trls.pnl.total / (trls.total or 1.0)
-
-                for wlname in ['won', 'lost']:
-                    wl = res[wlname]
-                    pnlcomm = trade.pnlcomm * wl * ls
-
-                    trls[wlname] += wl * ls  # long.won / short.won
-
-                    trls.pnl[wlname].total += pnlcomm
-                    trls.pnl[wlname].average = \
-                        trls.pnl[wlname].total / (trls[wlname] or 1.0)
-
-                    wm = trls.pnl[wlname].max or 0.0
-                    func = max if wlname == 'won' else min
-                    trls.pnl[wlname].max = func(wm, pnlcomm)
-
-            # =============================================================================
-            # 거래 기간(Length) 통계 계산
-            # =============================================================================
-            # Length
-            # 거래 기간
-            trades.len.total += trade.barlen
-            trades.len.average = trades.len.total / trades.total.closed
-            ml = trades.len.max or 0
-            trades.len.max = max(ml, trade.barlen)
-
-            ml = trades.len.min or MAXINT
-            trades.len.min = min(ml, trade.barlen)
+            # won/lost 와 long/short 는 서로 배타적이므로 해당하는 쪽만 갱신
+            # (반대쪽은 값이 바뀌지 않음. 단, 연속 기록은 초기화)
+            # 거래 속성은 한 번씩만 읽어 지역 변수로 사용
+            pnl, pnlcomm = trade.pnl, trade.pnlcomm  # 총손익, 순손익
+            barlen, long_pos = trade.barlen, trade.long  # 거래 기간, 롱 여부
+
+            won = pnlcomm >= 0.0  # 수익 거래 여부
+            iwl = 0 if won else 1  # 0: won, 1: lost
+            wlfunc = max if won else min  # 수익은 최대값, 손실은 최소값을 추적
+            ils = 0 if long_pos else 1  # 0: long, 1: short
+
+            # 완료된 모든 거래: 횟수, 손익, 거래 기간
+            tall = self._all
+            tall.total += 1  # 완료된 거래 수 증가
+            self._pnlgross += pnl
+            tall.pnl += pnlcomm
+            tall.barlen += barlen
+            tall.barlenmax = max(tall.barlenmax, barlen)
+            # a 0 minimum is kept only until the next closed trade
+            # 최소값 0 은 다음 완료 거래에서 다시 계산됨
+            m = tall.barlenmin or MAXINT
+            tall.barlenmin = min(m, barlen)
 
             # =============================================================================
-            # 승/패별 거래 기간 통계
+            # 승/패별 통계 및 연속 성과(Streak)
             # =============================================================================
-            # Length Won/Lost
-            # 승/패별 거래 기간
-            for wlname in ['won', 'lost']:
-                trwl = trades.len[wlname]
-                wl = res[wlname]
+            self._wl[1 - iwl].current = 0  # 반대쪽 연속 기록은 끊김
 
-                trwl.total += trade.barlen * wl
-                trwl.average = trwl.total / (trades[wlname].total or 1.0)
+            wl = self._wl[iwl]
+            wl.current += 1
+            wl.longest = max(wl.longest, wl.current)
 
-                m = trwl.max or 0
-                trwl.max = max(m, trade.barlen * wl)
-                if trade.barlen * wl:
-                    m = trwl.min or MAXINT
-                    trwl.min = min(m, trade.barlen * wl)
+            wl.total += 1
+            wl.pnl += pnlcomm
+            wl.pnlmax = wlfunc(wl.pnlmax, pnlcomm)
+            wl.barlen += barlen
+            wl.barlenmax = max(wl.barlenmax, barlen)
+            if barlen:  # 기간이 없는 거래는 최소값에서 제외
+                wl.barlenmin = min(wl.barlenmin, barlen)
 
             # =============================================================================
-            # 롱/숏별 거래 기간 통계
+            # 롱/숏별 통계
             # =============================================================================
-            # Length Long/Short
-            # 롱/숏별 거래 기간
-            for lsname in ['long', 'short']:
-                trls = trades.len[lsname]  # trades.len.long
-                ls = res['t' + lsname]  # tlong/tshort
-
-                barlen = trade.barlen * ls
-
-                trls.total += barlen  # trades.len.long.total
-                total_ls = trades[lsname].total   # trades.long.total
-                trls.average = trls.total / (total_ls or 1.0)
-
-                # =============================================================================
-                # 최대/최소 거래 기간
-                # =============================================================================
-                # max/min
-                # 최대/최소
-                m = trls.max or 0
-                trls.max = max(m, barlen)
-                m = trls.min or MAXINT
-                trls.min = min(m, barlen or m)
-
-                # =============================================================================
-                # 롱/숏별 승/패 거래 기간 통계
-                # =============================================================================
-                for wlname in ['won', 'lost']:
-                    wl = res[wlname]  # won/lost
-
-                    barlen2 = trade.barlen * ls * wl
-
-                    trls_wl = trls[wlname]  # trades.len.long.won
-                    trls_wl.total += barlen2  # trades.len.long.won.total
-
-                    trls_wl.average = \
-                        trls_wl.total / (trades[lsname][wlname] or 1.0)
-
-                    # =============================================================================
-                    # 최대/최소 거래 기간
-                    # =============================================================================
-                    # max/min
-                    # 최대/최소
-                    m = trls_wl.max or 0
-                    trls_wl.max = max(m, barlen2)
-                    m = trls_wl.min or MAXINT
-                    trls_wl.min = min(m, barlen2 or m)
+            ls = self._ls[ils]
+            ls.total += 1
+            ls.pnl += pnlcomm
+            ls.barlen += barlen
+            ls.barlenmax = max(ls.barlenmax, barlen)
+            if barlen:  # 기간이 없는 거래는 최소값에서 제외
+                ls.barlenmin = min(ls.barlenmin, barlen)
+
+            # 롱/숏별 승/패 통계
+            lswl = self._lswl[ils][iwl]
+            lswl.total += 1
+            lswl.pnl += pnlcomm
+            lswl.pnlmax = wlfunc(lswl.pnlmax, pnlcomm)
+            lswl.barlen += barlen
+            lswl.barlenmax = max(lswl.barlenmax, barlen)
+            if barlen:  # 기간이 없는 거래는 최소값에서 제외
+                lswl.barlenmin = min(lswl.barlenmin, barlen)
@@ -37,7 +37,7 @@ from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 
 
-import collections
+import array
 
 import backtrader as bt
 from backtrader import Order, Position
@@ -99,8 +99,19 @@ class Transactions(bt.Analyzer):
         # =============================================================================
         # 내부 변수 초기화
         # =============================================================================
-        self._positions = collections.defaultdict(Position)  # 데이터별 포지션 추적
         self._idnames = list(enumerate(self.strategy.getdatanames()))  # 데이터 이름과 인덱스 매핑
+        # 데이터별 포지션은 데이터 인덱스 순서의 리스트로 미리 생성하고
+        # 사이클마다 새로 만들지 않고 제자리에서 초기화
+        self._positions = [Position() for _ in self._idnames]
+        self._dnidx = {dname: i for i, dname in self._idnames}  # 이름 -> 인덱스
+        self._dirty = False  # 이번 사이클에 실행된 주문이 있는지 여부
+
+        # 거래 내역은 원시 날짜/시간 값과 함께 쌓아 두고
+        # get_analysis 에서 날짜/시간 키로 변환하여 결과에 반영
+        self._dtline = self.strategy.datetime
+        self._dtnums = array.array(str('d'))
+        self._entries = list()
+        self._nrows = 0  # 결과 딕셔너리에 이미 반영된 행의 수
 
     def notify_order(self, order):
         # =============================================================================
@@ -122,30 +133,49 @@ class Transactions(bt.Analyzer):
         # =============================================================================
         # 주문 실행 처리
         # =============================================================================
-        pos = self._positions[order.data._name]  # 해당 데이터의 포지션 가져오기
+        dname = order.data._name
+        pos_update = self._positions[self._dnidx[dname]].update  # 해당 데이터의 포지션 업데이트
         for exbit in order.executed.iterpending():
             if exbit is None:
                 break  # end of pending reached (대기 중인 실행 비트 끝에 도달)
 
             # 실행 비트의 수량과 가격으로 포지션 업데이트
-            pos.update(exbit.size, exbit.price)
+            pos_update(exbit.size, exbit.price)
+            self._dirty = True
 
     def next(self):
         # =============================================================================
         # 각 거래일마다 거래 내역 기록
         # =============================================================================
         # super(Transactions, self).next()  # let dtkey update
+        if not self._dirty:
+            return  # 실행된 주문이 없는 사이클은 기록할 내용이 없음
+
         entries = []
+        positions = self._positions
         for i, dname in self._idnames:
-            pos = self._positions.get(dname, None)
-            if pos is not None:
-                size, price = pos.size, pos.price
-                if size:
-                    # 포지션이 있는 경우 거래 내역에 추가
-                    # [수량, 가격, 데이터 인덱스, 데이터 이름, 가치(수량 × 가격)]
-                    entries.append([size, price, i, dname, -size * price])
+            pos = positions[i]
+            size, price = pos.size, pos.price
+            if size:
+                # 포지션 변화가 있는 경우 거래 내역에 추가
+                # [수량, 가격, 데이터 인덱스, 데이터 이름, 가치(수량 × 가격)]
+                entries.append([size, price, i, dname, -size * price])
+                pos.fix(0, 0.0)  # 다음 사이클을 위해 포지션 초기화
 
         if entries:
-            self.rets[self.strategy.datetime.datetime()] = entries
+            self._dtnums.append(self._dtline[0])
+            self._entries.append(entries)
+
+        self._dirty = False
+
+    def get_analysis(self):
+        # =============================================================================
+        # 아직 반영되지 않은 거래 내역을 결과 딕셔너리에 추가한 후 반환
+        # =============================================================================
+        dtnums, entries = self._dtnums, self._entries
+        tz = self._dtline._tz
+        for i in range(self._nrows, len(dtnums)):
+            self.rets[bt.num2date(dtnums[i], tz=tz)] = entries[i]
 
-        self._positions.clear()
+        self._nrows = len(dtnums)
+        return self.rets
@@ -41,12 +41,15 @@
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 
+import array
 import math
 
 import backtrader as bt
 from backtrader import TimeFrameAnalyzerBase
 from . import Returns
-from ..mathsupport import standarddev
+
+
+_NAN = float('NaN')  # placeholder for periods without a value yet (값이 없는 기간의 플레이스홀더)
 
 
 # =============================================================================
@@ -164,14 +167,19 @@ class VWR(TimeFrameAnalyzerBase):
             self._fundmode = self.p.fund
 
         # =============================================================================
-        # 가치 추적 리스트 초기화
+        # 가치 추적 배열 초기화
         # =============================================================================
+        # The initial value (pi) of a period is the final value (pn) of the
+        # previous one: only the 1st pi and the pns are kept
+        # 기간의 시작 가치(pi)는 이전 기간의 최종 가치(pn)이므로
+        # 첫 번째 pi 와 pn 배열만 보관
         if not self._fundmode:
-            self._pis = [self.strategy.broker.getvalue()]  # keep initial value (초기 가치 유지)
+            self._pi0 = self.strategy.broker.getvalue()  # keep initial value (초기 가치 유지)
         else:
-            self._pis = [self.strategy.broker.fundvalue]  # keep initial value (초기 가치 유지)
+            self._pi0 = self.strategy.broker.fundvalue  # keep initial value (초기 가치 유지)
 
-        self._pns = [None]  # keep final prices (value) (최종 가격(가치) 유지)
+        # pn 값은 배열('d')에 연속으로 저장하고, NaN 은 아직 값이 없는 기간의 플레이스홀더
+        self._pns = array.array(str('d'), [_NAN])  # keep final prices (value) (최종 가격(가치) 유지)
 
     def stop(self):
         # =============================================================================
@@ -180,14 +188,13 @@ class VWR(TimeFrameAnalyzerBase):
         super(VWR, self).stop()
         # =============================================================================
         # 마지막 'dt_over' 이후 값이 보이지 않는지 확인
-        # 그렇다면 'pi'가 잘못된 위치에 있고 'pn'이 None입니다. 제거
+        # 그렇다면 값이 없는 기간의 'pn'이 NaN입니다. 제거
         # =============================================================================
         # Check if no value has been seen after the last 'dt_over'
-        # If so, there is one 'pi' out of place and a None 'pn'. Purge
+        # If so, there is a NaN 'pn' for a period without values. Purge
         # 마지막 'dt_over' 이후 값이 보이지 않는지 확인
-        # 그렇다면 'pi'가 잘못된 위치에 있고 'pn'이 None입니다. 제거
-        if self._pns[-1] is None:
-            self._pis.pop()
+        # 그렇다면 값이 없는 기간의 'pn'이 NaN입니다. 제거
+        if math.isnan(self._pns[-1]):
             self._pns.pop()
 
         # =============================================================================
@@ -202,18 +209,27 @@ class VWR(TimeFrameAnalyzerBase):
         # =============================================================================
         # VWR 계산을 위한 편차 계산
         # =============================================================================
-        # make n 1 based in enumerate (number of periods and not index)
-        # enumerate에서 n을 1 기반으로 만듦 (인덱스가 아닌 기간 수)
-        # skip initial placeholders for synchronization
-        # 동기화를 위해 초기 플레이스홀더 건너뛰기
-        dts = []
-        for n, pipn in enumerate(zip(self._pis, self._pns), 1):
-            pi, pn = pipn
-
-            dt = pn / (pi * math.exp(ravg * n)) - 1.0
-            dts.append(dt)
-
-        sdev_p = standarddev(dts, bessel=True)
+        # The deviation of each period needs "ravg", which is only known now.
+        # Deviations and their variance (Welford) are computed in one pass
+        # 각 기간의 편차는 지금에서야 알 수 있는 "ravg" 가 필요하므로
+        # 편차와 그 분산(Welford 방식)을 한 번의 순회로 계산 (편차 리스트 없음)
+        # exp(ravg * n) == exp(ravg) ** n: one exp and a running product
+        # exp(ravg * n) 는 exp(ravg) 의 n 제곱이므로 exp 는 한 번만 계산하고 누적 곱 사용
+        fexp = math.exp(ravg)
+        factor = 1.0
+        count, mean, m2 = 0, 0.0, 0.0
+        pi = self._pi0
+        for pn in self._pns:
+            factor *= fexp  # n 번째 기간: exp(ravg * n)
+            dt = pn / (pi * factor) - 1.0
+            pi = pn  # last pn is pi in next period (마지막 pn이 다음 기간의 pi)
+
+            count += 1
+            delta = dt - mean
+            mean += delta / count
+            m2 += delta * (dt - mean)
+
+        sdev_p = math.sqrt(m2 / (count - 1))  # 표본 표준편차 (Bessel 보정)
 
         # =============================================================================
         # VWR 최종 계산
@@ -232,10 +248,9 @@ class VWR(TimeFrameAnalyzerBase):
 
     def _on_dt_over(self):
         # =============================================================================
-        # 시간 프레임 경계에서 가치 리스트 업데이트
+        # 시간 프레임 경계에서 가치 배열 업데이트
         # =============================================================================
-        self._pis.append(self._pns[-1])  # last pn is pi in next period (마지막 pn이 다음 기간의 pi)
-        self._pns.append(None)  # placeholder for [-1] operation ([-1] 연산을 위한 플레이스홀더)
+        self._pns.append(_NAN)  # placeholder for [-1] operation ([-1] 연산을 위한 플레이스홀더)
 
 
 VariabilityWeightedReturn = VWR
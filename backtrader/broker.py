@@ -68,9 +68,13 @@ class MetaBroker(MetaParams):
         }
 
         # 누락된 메서드가 있으면 자동으로 추가
+        # The translation is done for each class defining the original method,
+        # so that subclasses overriding it also get the alias pointing to it
+        # 원래 메서드를 정의한 클래스마다 별칭을 추가하여, 원래 메서드를 재정의한
+        # 하위 클래스의 별칭도 재정의된 메서드를 가리키도록 함
         for attr, trans in translations.items():
-            if not hasattr(cls, attr):
-                setattr(cls, name, getattr(cls, trans))
+            if attr not in dct and trans in dct:
+                setattr(cls, attr, dct[trans])
 
 
 # =============================================================================
@@ -99,7 +103,9 @@ class BrokerBase(with_metaclass(MetaBroker, object)):
         # init과 start에서 호출됨
         if None not in self.comminfo:
             # 기본 수수료 정보가 없으면 설정
-            self.comminfo = dict({None: self.p.commission})
+            self.comminfo[None] = self.p.commission
+
+        self._comminfos = dict()  # 데이터별로 찾아 둔 수수료 정보 캐시
 
     def start(self):
         # 브로커 시작 시 호출
@@ -123,12 +129,23 @@ class BrokerBase(with_metaclass(MetaBroker, object)):
         '''Retrieves the ``CommissionInfo`` scheme associated with the given
         ``data``'''
         # 주어진 데이터와 연관된 수수료 정보를 검색합니다
+        # The scheme is resolved once per data and kept until the schemes
+        # are changed with setcommission/addcommissioninfo or start
+        # 데이터마다 한 번만 찾고, 수수료 설정이 바뀌거나 시작될 때까지 보관
+        try:
+            return self._comminfos[data]
+        except KeyError:
+            pass
+
         if data._name in self.comminfo:
-            # 데이터별 수수료 정보가 있으면 반환
-            return self.comminfo[data._name]
+            # 데이터별 수수료 정보가 있으면 사용
+            comminfo = self.comminfo[data._name]
+        else:
+            # 데이터별 수수료 정보가 없으면 기본 수수료 정보 사용
+            comminfo = self.comminfo[None]
 
-        # 데이터별 수수료 정보가 없으면 기본 수수료 정보 반환
-        return self.comminfo[None]
+        self._comminfos[data] = comminfo
+        return comminfo
 
     def setcommission(self,
                       commission=0.0, margin=None, mult=1.0,
@@ -171,11 +188,13 @@ class BrokerBase(with_metaclass(MetaBroker, object)):
                             interest=interest, interest_long=interest_long,
                             leverage=leverage, automargin=automargin)
         self.comminfo[name] = comm
+        self._comminfos.clear()  # 캐시된 수수료 정보 무효화
 
     def addcommissioninfo(self, comminfo, name=None):
         '''Adds a ``CommissionInfo`` object that will be the default for all assets if
         ``name`` is ``None``'''
         self.comminfo[name] = comminfo
+        self._comminfos.clear()  # 캐시된 수수료 정보 무효화
 
     def getcash(self):
         raise NotImplementedError
@@ -183,6 +202,11 @@ class BrokerBase(with_metaclass(MetaBroker, object)):
     def getvalue(self, datas=None):
         raise NotImplementedError
 
+    def get_values_by_data(self, datas):
+        '''Returns a list with the individual value of each of the given
+        ``datas``, in the same order'''
+        return [self.getvalue([data]) for data in datas]
+
     def get_fundshares(self):
         '''Returns the current number of shares in the fund-like mode'''
         return 1.0  # the abstract mode has only 1 share
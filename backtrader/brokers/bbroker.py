@@ -525,12 +525,42 @@ class BackBroker(bt.BrokerBase):
 
     getvalue = get_value
 
+    def get_values_by_data(self, datas):
+        '''Returns a list with the individual value of each of the given
+        ``datas``, in the same order, as ``get_value([data])`` would do for
+        each of them, but walking the datas only once'''
+        self._process_cash_addition()
+
+        datavalue = self._get_datavalue
+        positions = self.positions
+        return [datavalue(data, self.getcommissioninfo(data), positions[data])
+                for data in datas]
+
     def get_value_lever(self, datas=None, mkt=False):
         # =============================================================================
         # 레버리지가 적용된 포트폴리오 가치 반환
         # =============================================================================
         return self.get_value(datas=datas, mkt=mkt)
 
+    def _process_cash_addition(self):
+        # =============================================================================
+        # 대기 중인 현금 추가분을 현금과 펀드 지분에 반영
+        # =============================================================================
+        while self._cash_addition:
+            c = self._cash_addition.popleft()
+            self._fundshares += c / self._fundval
+            self.cash += c
+
+    def _get_datavalue(self, data, comminfo, position):
+        # =============================================================================
+        # 단일 데이터의 포지션 가치 계산 (공매도는 음수)
+        # =============================================================================
+        # use valuesize:  returns raw value, rather than negative adj val
+        if not self.p.shortcash:
+            return comminfo.getvalue(position, data.close[0])
+
+        return comminfo.getvaluesize(position.size, data.close[0])
+
     def _get_value(self, datas=None, lever=False):
         # =============================================================================
         # 내부 포트폴리오 가치 계산 메서드
@@ -539,19 +569,12 @@ class BackBroker(bt.BrokerBase):
         pos_value_unlever = 0.0
         unrealized = 0.0
 
-        while self._cash_addition:
-            c = self._cash_addition.popleft()
-            self._fundshares += c / self._fundval
-            self.cash += c
+        self._process_cash_addition()
 
         for data in datas or self.positions:
             comminfo = self.getcommissioninfo(data)
             position = self.positions[data]
-            # use valuesize:  returns raw value, rather than negative adj val
-            if not self.p.shortcash:
-                dvalue = comminfo.getvalue(position, data.close[0])
-            else:
-                dvalue = comminfo.getvaluesize(position.size, data.close[0])
+            dvalue = self._get_datavalue(data, comminfo, position)
 
             dunrealized = comminfo.profitandloss(position.size, position.price,
                                                  data.close[0])
@@ -44,6 +44,7 @@ from __future__ import (absolute_import, division, print_function,
 import collections
 from copy import copy
 from datetime import date, datetime, timedelta
+import operator
 import threading
 import uuid
 
@@ -80,25 +81,30 @@ class IBOrderState(object):
                'commission', 'minCommission', 'maxCommission',
                'commissionCurrency', 'warningText']
 
+    __slots__ = tuple('m_' + f for f in _fields)
+    _getter = operator.attrgetter(*__slots__)  # 모든 필드를 한 번에 읽음
+
+    # 출력 형식은 클래스 정의 시 한 번만 생성
+    _FMT = '\n'.join(['--- ORDERSTATE BEGIN'] +
+                     [f.capitalize() + ': {}' for f in _fields] +
+                     ['--- ORDERSTATE END'])
+
     def __init__(self, orderstate):
         # =============================================================================
         # IB OrderState 객체에서 필요한 필드들을 추출하여 속성으로 설정
         # =============================================================================
-        for f in self._fields:
-            fname = 'm_' + f
-            setattr(self, fname, getattr(orderstate, fname))
+        # 한 번의 attrgetter 호출 결과를 튜플 언패킹으로 바로 대입
+        # (대입 순서는 _fields 의 순서와 같아야 함)
+        (self.m_status, self.m_initMargin, self.m_maintMargin,
+         self.m_equityWithLoan, self.m_commission, self.m_minCommission,
+         self.m_maxCommission, self.m_commissionCurrency,
+         self.m_warningText) = self._getter(orderstate)
 
     def __str__(self):
         # =============================================================================
         # 주문 상태 정보를 읽기 쉬운 형태로 출력
         # =============================================================================
-        txt = list()
-        txt.append('--- ORDERSTATE BEGIN')
-        for f in self._fields:
-            fname = 'm_' + f
-            txt.append('{}: {}'.format(f.capitalize(), getattr(self, fname)))
-        txt.append('--- ORDERSTATE END')
-        return '\n'.join(txt)
+        return self._FMT.format(*self._getter(self))
 
 
 # =============================================================================
@@ -59,8 +59,8 @@ class DrawDown(Observer):
                                                   **kwargs)
 
     def next(self):
-        self.lines.drawdown[0] = self._dd.rets.drawdown  # update drawdown
-        self.lines.maxdrawdown[0] = self._dd.rets.max.drawdown  # update max
+        self.lines.drawdown[0] = self._dd.ddstats.drawdown  # update drawdown
+        self.lines.maxdrawdown[0] = self._dd.ddstats.maxdrawdown  # update max
 
 
 class DrawDownLength(Observer):
@@ -81,8 +81,8 @@ class DrawDownLength(Observer):
         self._dd = self._owner._addanalyzer_slave(bt.analyzers.DrawDown)
 
     def next(self):
-        self.lines.len[0] = self._dd.rets.len  # update drawdown length
-        self.lines.maxlen[0] = self._dd.rets.max.len  # update max length
+        self.lines.len[0] = self._dd.ddstats.len  # update drawdown length
+        self.lines.maxlen[0] = self._dd.ddstats.maxlen  # update max length
 
 
 class DrawDown_Old(Observer):
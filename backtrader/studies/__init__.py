@@ -23,3 +23,7 @@ from __future__ import (absolute_import, division, print_function,
 
 
 from backtrader import Indicator
+
+# contrib 연구 모듈들을 이 패키지에 등록
+# (from backtrader.studies import Fractal 형태의 임포트도 지원)
+from . import contrib as contrib
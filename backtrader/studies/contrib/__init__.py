@@ -21,8 +21,12 @@
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 
-import backtrader as bt
+import sys
 
 from .import fractal as fractal
+
+# 상위 패키지(backtrader.studies)에 직접 등록 - bt.studies 는 지연 로드되며
+# 이 모듈은 backtrader.studies 초기화 도중에 임포트됨
+_studies = sys.modules[__name__.rpartition('.')[0]]
 for name in fractal.__all__:
-    setattr(bt.studies, name, getattr(fractal, name))
+    setattr(_studies, name, getattr(fractal, name))
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8; py-indent-offset:4 -*-
+###############################################################################
+#
+# Copyright (C) 2015-2023 Daniel Rodriguez
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+from __future__ import (absolute_import, division, print_function,
+                        unicode_literals)
+
+import os.path
+
+import testcommon
+
+import backtrader as bt
+import backtrader.indicators as btind
+
+
+class TestStrategy(bt.Strategy):
+    """
+    Annual Return 분석기 테스트를 위한 전략 클래스
+
+    이 전략은 SMA 크로스오버를 사용하여 매수/매도 신호를 생성하고,
+    Annual Return 분석기를 통해 연도별 수익률을 측정합니다.
+    """
+    params = (
+        ('period', 15),        # SMA 기간 (기본값: 15)
+    )
+
+    def __init__(self):
+        """전략 초기화"""
+        # SMA 지표와 크로스오버 신호 생성
+        self.sma = btind.SMA(self.data, period=self.p.period)
+        self.cross = btind.CrossOver(self.data.close, self.sma)
+
+    def next(self):
+        """각 바(bar)마다 호출되는 메인 로직"""
+        if not self.position.size:
+            if self.cross > 0.0:  # 가격이 SMA 위로 크로스
+                self.buy()
+
+        elif self.cross < 0.0:  # 가격이 SMA 아래로 크로스
+            self.close()
+
+
+# 테스트할 데이터 파일 (2005년과 2006년의 2개 연도를 포함)
+datafile = '2005-2006-day-001.txt'
+
+# 연도별 예상 수익률
+chkvals = {
+    2005: '0.038182',
+    2006: '0.029250',
+}
+
+
+def test_run(main=False):
+    """
+    Annual Return 분석기 테스트를 실행하는 메인 함수
+
+    Args:
+        main: 메인 출력 모드 여부 (True면 상세 정보 출력)
+    """
+    # 2년치 데이터 로드 (연도 경계를 검증하기 위함)
+    datapath = os.path.join(testcommon.modpath, testcommon.dataspath, datafile)
+    datas = [testcommon.DATAFEED(dataname=datapath)]
+
+    cerebros = testcommon.runtest(datas,
+                                  TestStrategy,
+                                  plot=main,
+                                  analyzer=(bt.analyzers.AnnualReturn, {}))
+
+    # 각 Cerebro 객체에서 결과 분석
+    for cerebro in cerebros:
+        strat = cerebro.runstrats[0][0]  # 최적화 없음, 단일 전략만
+        analyzer = strat.analyzers[0]     # 단일 분석기만
+        analysis = analyzer.get_analysis()  # 분석 결과 가져오기
+
+        if main:
+            print(analysis)
+        else:
+            # 연도 순서와 수익률 검증
+            assert list(analysis.keys()) == list(chkvals.keys())
+            for year, chkval in chkvals.items():
+                assert '%f' % analysis[year] == chkval
+
+            assert analyzer.rets == list(analysis.values())
+
+
+if __name__ == '__main__':
+    # 스크립트가 직접 실행될 때 메인 모드로 테스트 실행
+    test_run(main=True)
@@ -21,6 +21,10 @@
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 
+import os.path
+import subprocess
+import sys
+
 import testcommon
 
 import backtrader as bt
@@ -66,6 +70,22 @@ def test_run(main=False):
                        chkvals=chkvals)    # 예상 값들
 
 
+def test_import_forms():
+    """
+    backtrader.studies 를 직접 임포트해도 contrib 스터디에 접근 가능한지 확인
+
+    bt.studies 는 지연 로드되므로 새 인터프리터에서 두 가지 임포트 형태를 검사
+    """
+    rootdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    codes = [
+        'from backtrader.studies import Fractal',
+        'import backtrader.studies; import backtrader as bt; '
+        'bt.studies.Fractal',
+    ]
+    for code in codes:
+        subprocess.check_call([sys.executable, '-c', code], cwd=rootdir)
+
+
 if __name__ == '__main__':
     # 스크립트가 직접 실행될 때 메인 모드로 테스트 실행
     test_run(main=True)